@@ -1,28 +1,42 @@
 """
 DepCycle - A dependency graph visualization tool for Python projects.
 
-DepCycle helps developers understand complex codebases by automatically 
+DepCycle helps developers understand complex codebases by automatically
 generating visual maps of module dependencies.
 """
 
+import importlib
+
 __version__ = "0.2.0"
 
-from .cli import DepCycleCLI
-from .config import Config
-from .graph import DependencyGraph, ModuleNode, ModuleType
-from .parsing import Project, ASTParser
-from .rendering import IGraphVisualizer, GraphvizVisualizer, HtmlVisualizer
-
-__all__ = [
-    'DepCycleCLI',
-    'Config',
-    'DependencyGraph',
-    'ModuleNode',
-    'ModuleType',
-    'Project',
-    'ASTParser',
-    'IGraphVisualizer',
-    'GraphvizVisualizer',
-    'HtmlVisualizer',
-]
+# Public names and the submodule each one lives in. Imports happen lazily
+# via PEP 562 __getattr__, so `import depcycle` stays cheap and a CLI
+# --help run never pays for the graph or rendering machinery.
+_LAZY_EXPORTS = {
+    'DepCycleCLI': '.cli',
+    'Config': '.config',
+    'DependencyGraph': '.graph',
+    'ModuleNode': '.graph',
+    'ModuleType': '.graph',
+    'Project': '.parsing',
+    'ASTParser': '.parsing',
+    'IGraphVisualizer': '.rendering',
+    'GraphvizVisualizer': '.rendering',
+    'HtmlVisualizer': '.rendering',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    """Resolve re-exported names on first access and cache them."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = attr  # subsequent lookups bypass __getattr__
+    return attr
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
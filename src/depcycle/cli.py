@@ -54,7 +54,9 @@ class DepCycleCLI:
             exclude_patterns=parsed_args.exclude,
             show_third_party=not parsed_args.no_third_party,
             show_stdlib=not parsed_args.no_stdlib,
-            include_all=parsed_args.include_all
+            include_all=parsed_args.include_all,
+            jobs=parsed_args.jobs,
+            collapse_external=parsed_args.collapse_external
         )
         
         # Validate project path
@@ -178,6 +180,22 @@ Examples:
             help='Exclude standard library modules from the graph'
         )
         
+        parser.add_argument(
+            '--collapse-external',
+            action='store_true',
+            help='Collapse stdlib/third-party modules into one node per top-level '
+                 'package. Only affects graphs that contain such nodes; the scanner '
+                 'currently creates nodes for project files only, so this applies to '
+                 'graphs extended programmatically via add_node()'
+        )
+
+        parser.add_argument(
+            '-j', '--jobs',
+            type=int,
+            default=None,
+            help='Number of worker processes for parsing (default: auto based on project size)'
+        )
+
         parser.add_argument(
             '--include-all',
             action='store_true',
@@ -1,5 +1,6 @@
 """Configuration class for DepCycle settings."""
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
@@ -27,63 +28,57 @@ DEFAULT_EXCLUDE_PATTERNS = [
 ]
 
 
+@dataclass(frozen=True)
 class Config:
     """
     Holds all configuration settings for a DepCycle run.
-    
+
     This class encapsulates all the options that control how DepCycle
-    analyzes and visualizes a Python project.
-    
+    analyzes and visualizes a Python project. Instances are immutable:
+    a Config is built once and then only read, so freezing it rules out
+    accidental mutation mid-run.
+
     Attributes:
         project_path (Path): Path to the project root directory.
         output_file (Path): Path where the output visualization should be saved.
         output_format (str): Format for the output ('png', 'svg', 'html').
-        exclude_patterns (List[str]): Glob patterns for files to exclude.
+        exclude_patterns (Optional[List[str]]): Glob patterns for files to exclude.
+                                                Merged with the defaults on init
+                                                unless include_all is set.
         show_third_party (bool): Whether to include third-party modules.
         show_stdlib (bool): Whether to include standard library modules.
         include_all (bool): Whether to include files normally excluded by default patterns.
+        jobs (Optional[int]): Number of worker processes for parsing.
+                              None picks a sensible default based on project size.
+        collapse_external (bool): Whether to collapse stdlib/third-party modules
+                                  into one aggregate node per top-level package.
+                                  Only affects graphs containing such nodes;
+                                  build() creates nodes for project files only,
+                                  so this currently applies to graphs extended
+                                  via DependencyGraph.add_node().
     """
-    
-    def __init__(
-        self, 
-        project_path: Path, 
-        output_file: Path, 
-        output_format: str = "png", 
-        exclude_patterns: Optional[List[str]] = None, 
-        show_third_party: bool = True,
-        show_stdlib: bool = True,
-        include_all: bool = False
-    ):
-        self.project_path = project_path
-        self.output_file = output_file
-        self.output_format = output_format
-        self.show_third_party = show_third_party
-        self.show_stdlib = show_stdlib
-        self.include_all = include_all
-        
-        # Merge default exclusions with user-specified ones
-        user_patterns = exclude_patterns if exclude_patterns is not None else []
-        if include_all:
+
+    project_path: Path
+    output_file: Path
+    output_format: str = "png"
+    exclude_patterns: Optional[List[str]] = None
+    show_third_party: bool = True
+    show_stdlib: bool = True
+    include_all: bool = False
+    jobs: Optional[int] = None
+    collapse_external: bool = False
+
+    def __post_init__(self):
+        """Merge default exclusions with user-specified ones."""
+        user_patterns = self.exclude_patterns if self.exclude_patterns is not None else []
+        if self.include_all:
             # If include_all is True, only use user-specified patterns
-            self.exclude_patterns = user_patterns
+            merged = list(user_patterns)
         else:
             # Merge defaults with user patterns, avoiding duplicates
-            self.exclude_patterns = list(DEFAULT_EXCLUDE_PATTERNS)
+            merged = list(DEFAULT_EXCLUDE_PATTERNS)
             for pattern in user_patterns:
-                if pattern not in self.exclude_patterns:
-                    self.exclude_patterns.append(pattern)
-
-    def __repr__(self) -> str:
-        """Provides a developer-friendly string representation of the Config object."""
-        return (
-            f"{self.__class__.__name__}("
-            f"project_path={self.project_path!r}, "
-            f"output_file={self.output_file!r}, "
-            f"output_format={self.output_format!r}, "
-            f"exclude_patterns={self.exclude_patterns!r}, "
-            f"show_third_party={self.show_third_party!r}, "
-            f"show_stdlib={self.show_stdlib!r}, "
-            f"include_all={self.include_all!r}"
-            ")"
-        )
-
+                if pattern not in merged:
+                    merged.append(pattern)
+        # The dataclass is frozen, so the merged list is set via object.__setattr__
+        object.__setattr__(self, 'exclude_patterns', merged)
@@ -1,5 +1,7 @@
 """DependencyGraph class representing the core graph data structure."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Optional
 
@@ -8,6 +10,59 @@ from ..parsing.project import Project
 from ..parsing.ast_parser import ASTParser
 from ..config import Config
 
+# Below this many files, worker processes cost more to spawn than
+# sequential parsing costs outright
+_PARALLEL_THRESHOLD = 50
+
+# Below this many nodes, the pure-Python DFS beats building a sparse
+# matrix for SciPy's strongly-connected-components pass
+_SCC_SCIPY_THRESHOLD = 500
+
+# Python standard library modules (partial list)
+_STDLIB_MODULES = frozenset({
+    'os', 'sys', 'pathlib', 'json', 'xml', 'csv', 'datetime',
+    'time', 'random', 'hashlib', 'uuid', 'collections', 'itertools',
+    'functools', 'operator', 'math', 'statistics', 're', 'string',
+    'io', 'pickle', 'copy', 'abc', 'enum', 'dataclasses', 'typing',
+    'inspect', 'ast', 'traceback', 'logging', 'argparse', 'getopt',
+    'socket', 'http', 'urllib', 'email', 'html', 'textwrap', 'pprint',
+    'subprocess', 'threading', 'multiprocessing', 'asyncio', 'queue',
+    'weakref', 'gc', 'contextlib', 'decorator', 'profile', 'cProfile',
+    'doctest', 'unittest', 'pdb', 'dis', 'compileall', 'py_compile',
+    'cmd', 'shlex', 'configparser', 'fileinput', 'locale', 'gettext',
+    'calendar', 'codecs', 'difflib', 'fnmatch', 'glob',
+    'linecache', 'shutil', 'tempfile', 'mmap', 'readline', 'rlcompleter',
+    'sqlite3', 'zlib', 'gzip', 'bz2', 'lzma', 'zipfile', 'tarfile',
+    'netrc', 'xdrlib', 'plistlib',
+    'hmac', 'secrets', 'base64', 'binascii', 'struct',
+    'unicodedata', 'stringprep', 'lib2to3'
+})
+
+
+class SoAView:
+    """
+    Struct-of-arrays snapshot of a DependencyGraph.
+
+    Render loops iterate the graph several times; chasing ModuleNode
+    references costs an attribute load per field per visit. This view lays
+    the same data out as parallel arrays indexed by node position, so hot
+    loops work on ints and list slots instead of objects.
+
+    Attributes:
+        names (List[str]): Module name per node index.
+        name_to_index (Dict[str, int]): Reverse lookup from name to index.
+        module_types (List[ModuleType]): Module type per node index.
+        dep_indices (List[List[int]]): Dependency node indices per node index.
+    """
+
+    __slots__ = ('names', 'name_to_index', 'module_types', 'dep_indices')
+
+    def __init__(self, names, name_to_index, module_types, dep_indices):
+        self.names = names
+        self.name_to_index = name_to_index
+        self.module_types = module_types
+        self.dep_indices = dep_indices
+
 
 class DependencyGraph:
     """
@@ -21,6 +76,9 @@ class DependencyGraph:
         """Initialize an empty dependency graph."""
         self.nodes: Dict[str, ModuleNode] = {}
         self._project_root: Optional[Path] = None
+        self._cycles_cache: Dict[int, List[List[ModuleNode]]] = {}
+        self._soa_cache: Optional[SoAView] = None
+        self._soa_fingerprint: Optional[int] = None
     
     def build(self, project: Project, parser: ASTParser, config: Config):
         """
@@ -28,10 +86,10 @@ class DependencyGraph:
         
         This is the main orchestration method that:
         1. Discovers all Python files in the project
-        2. Creates ModuleNode objects for each file
-        3. Extracts imports using the AST parser
+        2. Extracts imports using the AST parser (in parallel for large projects)
+        3. Creates ModuleNode objects for each file, classifying each module
+           and skipping types the config hides
         4. Resolves dependencies between nodes
-        5. Classifies modules by type
         
         Args:
             project: The Project instance containing the files to analyze.
@@ -43,24 +101,70 @@ class DependencyGraph:
         # Step 1: Discover all Python files
         python_files = project.get_python_files(config.exclude_patterns)
         
-        # Step 2: Create nodes for each Python file
+        # Step 2: Extract imports, fanning out to worker processes for
+        # large projects (each file parses independently)
+        imports_by_file = self._extract_imports(python_files, parser, config.jobs)
+
+        # Step 3: Create nodes for each Python file. Classification happens
+        # here so modules the config hides are never allocated: dependency
+        # resolution below only matches existing nodes, so no post-hoc
+        # filtering or edge cleanup is needed.
         for file_path in python_files:
             node = self._create_module_node(file_path, project.root_path)
+            node.module_type = self._classify_module(node)
+            if node.module_type == ModuleType.THIRD_PARTY and not config.show_third_party:
+                continue
+            if node.module_type == ModuleType.STDLIB and not config.show_stdlib:
+                continue
+            node.raw_imports = imports_by_file[file_path]
             self.nodes[node.name] = node
-            
-            # Extract imports using AST
-            raw_imports = parser.get_imports_from_file(file_path)
-            node.raw_imports = raw_imports
-        
-        # Step 3: Resolve dependencies
+
+        # Step 4: Resolve dependencies
         self._resolve_dependencies()
-        
-        # Step 4: Classify modules
-        self._classify_modules()
-        
-        # Step 5: Filter based on config
-        self._apply_filters(config)
+
+        self._cycles_cache.clear()
+        self._soa_cache = None
     
+    def _extract_imports(
+        self,
+        python_files: List[Path],
+        parser: ASTParser,
+        jobs: Optional[int],
+    ) -> Dict[Path, Set[str]]:
+        """
+        Extract raw imports for each file, in parallel where it pays off.
+
+        Parsing is embarrassingly parallel (files are independent), so large
+        projects fan out to a process pool; graph mutation stays
+        single-threaded in the caller.
+
+        Args:
+            python_files: The files to parse.
+            parser: The ASTParser for extracting imports.
+            jobs: Worker process count; None selects cpu_count for projects
+                  of _PARALLEL_THRESHOLD or more files, and 1 otherwise.
+
+        Returns:
+            Mapping of file path to the set of raw import strings found.
+        """
+        if jobs is None:
+            if len(python_files) >= _PARALLEL_THRESHOLD:
+                jobs = os.cpu_count() or 1
+            else:
+                jobs = 1
+
+        if jobs <= 1 or len(python_files) < 2:
+            return {
+                file_path: parser.get_imports_from_file(file_path)
+                for file_path in python_files
+            }
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(
+                parser.get_imports_from_file, python_files, chunksize=32
+            )
+            return dict(zip(python_files, results))
+
     def _create_module_node(self, file_path: Path, project_root: Path) -> ModuleNode:
         """
         Create a ModuleNode from a file path.
@@ -203,79 +307,32 @@ class DependencyGraph:
         
         return '.'.join(result_parts)
     
-    def _classify_modules(self):
+    def _classify_module(self, node: ModuleNode) -> ModuleType:
         """
-        Classify each module as LOCAL, THIRD_PARTY, or STDLIB.
-        
+        Classify a module as LOCAL, THIRD_PARTY, or STDLIB.
+
         This is currently simplified - in a full implementation, you'd want
         to check against standard library and installed packages.
-        """
-        # Python standard library modules (partial list)
-        stdlib_modules = {
-            'os', 'sys', 'pathlib', 'json', 'xml', 'csv', 'datetime',
-            'time', 'random', 'hashlib', 'uuid', 'collections', 'itertools',
-            'functools', 'operator', 'math', 'statistics', 're', 'string',
-            'io', 'pickle', 'copy', 'abc', 'enum', 'dataclasses', 'typing',
-            'inspect', 'ast', 'traceback', 'logging', 'argparse', 'getopt',
-            'socket', 'http', 'urllib', 'email', 'html', 'textwrap', 'pprint',
-            'subprocess', 'threading', 'multiprocessing', 'asyncio', 'queue',
-            'weakref', 'gc', 'contextlib', 'decorator', 'profile', 'cProfile',
-            'doctest', 'unittest', 'pdb', 'dis', 'compileall', 'py_compile',
-            'cmd', 'shlex', 'configparser', 'fileinput', 'locale', 'gettext',
-            'argparse', 'calendar', 'codecs', 'difflib', 'fnmatch', 'glob',
-            'linecache', 'shutil', 'tempfile', 'mmap', 'readline', 'rlcompleter',
-            'sqlite3', 'zlib', 'gzip', 'bz2', 'lzma', 'zipfile', 'tarfile',
-            'csv', 'configparser', 'netrc', 'xdrlib', 'plistlib', 'hashlib',
-            'hmac', 'secrets', 'base64', 'binascii', 'struct', 'codecs',
-            'unicodedata', 'stringprep', 'readline', 'rlcompleter', 'lib2to3'
-        }
-        
-        for node in self.nodes.values():
-            # Skip if already classified as LOCAL (from file path)
-            if node.module_type == ModuleType.LOCAL:
-                continue
-            
-            # Check if it's a standard library module
-            module_base = node.name.split('.')[0]
-            if module_base in stdlib_modules:
-                node.module_type = ModuleType.STDLIB
-            else:
-                # Assume third-party for now
-                # In production, you might check installed packages
-                node.module_type = ModuleType.THIRD_PARTY
-    
-    def _apply_filters(self, config: Config):
-        """
-        Apply filtering based on configuration options.
-        
+
         Args:
-            config: Configuration settings.
+            node: The ModuleNode to classify.
+
+        Returns:
+            The ModuleType for the node.
         """
-        if config.show_third_party and config.show_stdlib:
-            return  # Nothing to filter
-        
-        # Build set of modules to keep
-        keep_modules = set()
-        for node in self.nodes.values():
-            if node.module_type == ModuleType.LOCAL:
-                keep_modules.add(node.name)
-            elif node.module_type == ModuleType.THIRD_PARTY and config.show_third_party:
-                keep_modules.add(node.name)
-            elif node.module_type == ModuleType.STDLIB and config.show_stdlib:
-                keep_modules.add(node.name)
-        
-        # Remove filtered nodes
-        filtered_out = set(self.nodes.keys()) - keep_modules
-        for module_name in filtered_out:
-            del self.nodes[module_name]
-        
-        # Clean up dependencies pointing to removed nodes
-        for node in self.nodes.values():
-            node.dependencies = {
-                dep for dep in node.dependencies 
-                if dep.name in self.nodes
-            }
-    
+        # Keep an existing LOCAL classification (from file path)
+        if node.module_type == ModuleType.LOCAL:
+            return ModuleType.LOCAL
+
+        # Check if it's a standard library module
+        module_base = node.name.split('.')[0]
+        if module_base in _STDLIB_MODULES:
+            return ModuleType.STDLIB
+
+        # Assume third-party for now
+        # In production, you might check installed packages
+        return ModuleType.THIRD_PARTY
+
     def add_node(self, node: ModuleNode):
         """
         Add a node to the graph.
@@ -284,14 +341,110 @@ class DependencyGraph:
             node: The ModuleNode to add.
         """
         self.nodes[node.name] = node
+        self._cycles_cache.clear()
+        self._soa_cache = None
     
+    def as_soa(self) -> SoAView:
+        """
+        Return a memoized struct-of-arrays view of the graph.
+
+        The view is shared between callers, so multiple render backends in
+        one run pay for the conversion once. It is keyed by the edge-set
+        fingerprint: edges are added by mutating node.dependencies directly,
+        which no graph method observes, so the fingerprint is what detects
+        that the cached view is stale. Dependencies pointing outside the
+        graph are dropped, which lets consumers skip per-edge membership
+        checks.
+
+        Returns:
+            The SoAView for the current graph state.
+        """
+        fingerprint = self._edges_fingerprint()
+        if self._soa_cache is not None and self._soa_fingerprint == fingerprint:
+            return self._soa_cache
+
+        names = list(self.nodes.keys())
+        name_to_index = {name: index for index, name in enumerate(names)}
+        module_types = [node.module_type for node in self.nodes.values()]
+        dep_indices = [
+            [
+                name_to_index[dependency.name]
+                for dependency in node.dependencies
+                if dependency.name in name_to_index
+            ]
+            for node in self.nodes.values()
+        ]
+
+        self._soa_cache = SoAView(names, name_to_index, module_types, dep_indices)
+        self._soa_fingerprint = fingerprint
+        return self._soa_cache
+
+    def _edges_fingerprint(self) -> int:
+        """
+        Compute a structural hash of the graph's edge set.
+
+        Cycles depend only on the edges, so this fingerprint identifies
+        graphs with identical cycle structure regardless of how they were
+        built or mutated.
+
+        Returns:
+            A hash of the frozen (source, target) edge name pairs.
+        """
+        return hash(frozenset(
+            (node.name, dependency.name)
+            for node in self.nodes.values()
+            for dependency in node.dependencies
+        ))
+
     def find_cycles(self) -> List[List[ModuleNode]]:
         """
         Detect all cycles in the dependency graph.
-        
+
         Uses Depth-First Search (DFS) to find strongly connected components
-        or cycles. Returns all circular dependencies found.
-        
+        or cycles. Returns all circular dependencies found. On large graphs
+        the DFS is confined to nontrivial strongly connected components
+        found by SciPy's C implementation first, when SciPy is available.
+
+        The result is memoized against a fingerprint of the edge set, so
+        repeated calls on an unchanged graph (e.g. once from the CLI report
+        and once per render backend) detect cycles only once.
+
+        Returns:
+            List of cycles, where each cycle is a list of ModuleNodes.
+        """
+        fingerprint = self._edges_fingerprint()
+        cached = self._cycles_cache.get(fingerprint)
+        if cached is not None:
+            # Hand out a copy so callers that sort or trim the result
+            # cannot corrupt the memoized list
+            return list(cached)
+
+        cycles = None
+        if len(self.nodes) >= _SCC_SCIPY_THRESHOLD:
+            try:
+                cycles = self._find_cycles_scipy()
+            except ImportError:
+                pass  # SciPy is optional; fall back to the pure-Python DFS
+        if cycles is None:
+            cycles = self._find_cycles_dfs(self.nodes.values())
+
+        self._cycles_cache[fingerprint] = cycles
+        return list(cycles)
+
+    def _find_cycles_dfs(
+        self,
+        nodes,
+        allowed: Optional[Set[str]] = None,
+    ) -> List[List[ModuleNode]]:
+        """
+        Find cycles by recursive DFS over the given nodes.
+
+        Args:
+            nodes: The ModuleNodes to search from.
+            allowed: When given, the search only follows dependencies whose
+                     names are in this set (used to confine the DFS to one
+                     strongly connected component).
+
         Returns:
             List of cycles, where each cycle is a list of ModuleNodes.
         """
@@ -299,14 +452,16 @@ class DependencyGraph:
         visited = set()
         rec_stack = set()
         path = []
-        
+
         def dfs(node: ModuleNode):
             """Recursive DFS helper for cycle detection."""
             visited.add(node.name)
             rec_stack.add(node.name)
             path.append(node)
-            
+
             for dependency in node.dependencies:
+                if allowed is not None and dependency.name not in allowed:
+                    continue
                 if dependency.name not in visited:
                     if dfs(dependency):
                         return True
@@ -315,16 +470,68 @@ class DependencyGraph:
                     cycle_start = path.index(dependency)
                     cycles.append(path[cycle_start:] + [dependency])
                     return True
-            
+
             rec_stack.remove(node.name)
             path.pop()
             return False
-        
+
         # Run DFS on all nodes
-        for node in self.nodes.values():
+        for node in nodes:
             if node.name not in visited:
                 dfs(node)
-        
+
+        return cycles
+
+    def _find_cycles_scipy(self) -> List[List[ModuleNode]]:
+        """
+        Find cycles using SciPy's strongly-connected-components pass.
+
+        Builds a CSR adjacency matrix from the SoA view and labels SCCs in
+        C; the Python DFS then only runs inside components that can contain
+        a cycle (size above one, or a single node with a self-loop), which
+        are typically tiny subgraphs.
+
+        Returns:
+            List of cycles, where each cycle is a list of ModuleNodes.
+
+        Raises:
+            ImportError: If SciPy is not installed.
+        """
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        soa = self.as_soa()
+        node_count = len(soa.names)
+        if node_count == 0:
+            return []
+
+        indices = []
+        indptr = [0]
+        for dep_indices in soa.dep_indices:
+            indices.extend(dep_indices)
+            indptr.append(len(indices))
+        adjacency = csr_matrix(
+            ([1] * len(indices), indices, indptr), shape=(node_count, node_count)
+        )
+
+        _, labels = connected_components(
+            adjacency, directed=True, connection='strong'
+        )
+
+        components: Dict[int, List[int]] = {}
+        for index, label in enumerate(labels):
+            components.setdefault(label, []).append(index)
+
+        cycles = []
+        for members in components.values():
+            if len(members) == 1:
+                index = members[0]
+                if index not in soa.dep_indices[index]:
+                    continue  # Singleton without a self-loop: acyclic
+            member_names = {soa.names[index] for index in members}
+            member_nodes = [self.nodes[soa.names[index]] for index in members]
+            cycles.extend(self._find_cycles_dfs(member_nodes, allowed=member_names))
+
         return cycles
     
     def __repr__(self) -> str:
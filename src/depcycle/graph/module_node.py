@@ -1,3 +1,4 @@
+import sys
 from enum import Enum
 from pathlib import Path
 from typing import Set, Optional
@@ -27,7 +28,10 @@ class ModuleNode:
     """
 
     def __init__(self, name: str, file_path: Optional[Path], module_type: ModuleType):
-        self.name: str = name
+        # Interning makes the many dict/set operations keyed on node names
+        # hit the pointer-equality fast path, and deduplicates each name
+        # across nodes, edges, and cycle sets
+        self.name: str = sys.intern(name)
         self.file_path: Optional[Path] = file_path
         self.module_type: ModuleType = module_type
         self.raw_imports: Set[str] = set()
@@ -1,54 +1,247 @@
 """ASTParser class for extracting import statements from Python files."""
 
 import ast
+import hashlib
+import os
+import pickle
+import re
+import sys
 from pathlib import Path
-from typing import Set
+from typing import Dict, Optional, Set, Tuple
+
+
+# In-memory cache of extracted imports, keyed by file path.
+# Each entry stores (st_mtime_ns, st_size, imports) so a changed file
+# is re-parsed automatically on the next call.
+_memory_cache: Dict[str, Tuple[int, int, Set[str]]] = {}
+
+
+def _disk_cache_dir() -> Path:
+    """Return the directory used for the persistent import cache."""
+    base = os.environ.get('XDG_CACHE_HOME')
+    if base:
+        return Path(base) / 'depcycle' / 'ast'
+    return Path.home() / '.cache' / 'depcycle' / 'ast'
+
+
+def _disk_cache_key(content: str) -> str:
+    """
+    Compute a cache key for a file's source text.
+
+    The key mixes in the Python version and the depcycle version so stale
+    entries are never reused across upgrades; content hashing makes
+    invalidation automatic when a file changes.
+    """
+    from .. import __version__
+
+    tag = f"py{sys.version_info[0]}.{sys.version_info[1]}-depcycle{__version__}"
+    return hashlib.sha256((content + tag).encode('utf-8')).hexdigest()
+
+
+def _disk_cache_read(key: str) -> Optional[Set[str]]:
+    """Load cached imports for a key, or None if absent/unreadable."""
+    cache_file = _disk_cache_dir() / f"{key}.pkl"
+    try:
+        with open(cache_file, 'rb') as f:
+            imports = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    if isinstance(imports, set):
+        return imports
+    return None
+
+
+def _disk_cache_write(key: str, imports: Set[str]):
+    """Persist extracted imports for a key; failures are non-fatal."""
+    cache_dir = _disk_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_dir / f"{key}.pkl", 'wb') as f:
+            pickle.dump(imports, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Cache is best-effort; never fail the parse over it
+
+
+# Matches simple single-line import statements. Group 1 is the name list of
+# a plain "import a, b as c"; groups 2 and 3 are the module and name list of
+# a "from x import y" statement.
+_FAST_IMPORT_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'import[ \t]+([\w. \t,]+?)'
+    r'|from[ \t]+(\.*[\w.]*)[ \t]+import[ \t]+([\w. \t,*]+?)'
+    r')[ \t]*(?:#.*)?$',
+    re.M,
+)
+
+# Constructs that make the regex fast path unreliable: triple-quoted strings
+# that could contain import-looking lines, line continuations, compound
+# statements, semicolons, and parenthesized import lists. These are cheap
+# substring checks; a false positive only means taking the (always correct)
+# AST path.
+_FAST_PATH_DISQUALIFIERS = ('"""', "'''", '\\', ';', '(', 'if', 'try', 'def', 'class')
+
+
+def _scan_imports_fast(content: str) -> Optional[Set[str]]:
+    """
+    Extract imports with a single regex pass over simple files.
+
+    Only called when the source contains none of the constructs in
+    _FAST_PATH_DISQUALIFIERS, so every import statement fits on one line.
+    Any line carrying the token 'import' that the regex cannot match
+    (unusual-but-legal spellings like 'from.x import y') forces the AST
+    fallback rather than being silently dropped. Emits exactly the same
+    import strings as _ImportVisitor would for the matched statements.
+
+    Args:
+        content: The file's source text.
+
+    Returns:
+        Set of import strings, or None if any import-bearing line has a
+        shape the scanner cannot confirm (caller falls back to ast.parse).
+    """
+    imports = set()
+
+    for line in content.splitlines():
+        if 'import' not in line:
+            continue
+        match = _FAST_IMPORT_RE.match(line)
+        if match is None:
+            return None
+        plain, module, names = match.groups()
+
+        if plain is not None:
+            # import a, b as c -> "a", "b"
+            for token in plain.split(','):
+                parts = token.split()
+                if len(parts) == 1:
+                    imports.add(parts[0])
+                elif len(parts) == 3 and parts[1] == 'as':
+                    imports.add(parts[0])
+                else:
+                    return None
+            continue
+
+        if not module:
+            return None
+
+        if module.startswith('.'):
+            # Relative import: mirror _ImportVisitor's dotted markers
+            imports.add(module)
+            for token in names.split(','):
+                parts = token.split()
+                if len(parts) == 1:
+                    name = parts[0]
+                elif len(parts) == 3 and parts[1] == 'as':
+                    name = parts[0]
+                else:
+                    return None
+                if name == '*':
+                    continue
+                if set(module) == {'.'}:
+                    imports.add(f"{module}{name}")
+                else:
+                    imports.add(f"{module}.{name}")
+        else:
+            # Absolute import: full dotted names including imported items
+            for token in names.split(','):
+                parts = token.split()
+                if len(parts) == 1:
+                    name = parts[0]
+                elif len(parts) == 3 and parts[1] == 'as':
+                    name = parts[0]
+                else:
+                    return None
+                imports.add(f"{module}.{name}")
+
+    return imports
 
 
 class ASTParser:
     """
     A stateless utility using AST to find all raw import strings from a file.
-    
+
     This class uses Python's built-in ast module to safely parse Python files
     and extract import statements without executing the code.
+
+    Results are cached at two levels: an in-memory table keyed by
+    (path, mtime, size) for repeated calls within one process, and a
+    content-addressed pickle cache on disk (~/.cache/depcycle/ast) so
+    unchanged files skip ast.parse entirely across runs. Only the extracted
+    import strings are cached, never the AST itself.
     """
-    
+
     @staticmethod
     def get_imports_from_file(file_path: Path) -> Set[str]:
         """
         Extract all import statements from a Python file.
-        
+
         Parses the file using AST and collects:
         - import module
         - from module import ...
         - import module as alias (returns original module)
         - from module import item as alias (returns module.item)
-        
+
         Args:
             file_path: Path to the Python file to parse.
-        
+
         Returns:
             Set of import strings found in the file.
-        
+
         Raises:
             SyntaxError: If the file contains invalid Python syntax.
             FileNotFoundError: If the file doesn't exist.
         """
+        stat = os.stat(file_path)
+        cache_key = str(file_path)
+
+        # Fast path: unchanged file already parsed in this process
+        cached = _memory_cache.get(cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return set(cached[2])
+
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
         except UnicodeDecodeError:
             # Skip non-UTF-8 files gracefully
             return set()
-        
+
+        # Second chance: same content seen in a previous run
+        disk_key = _disk_cache_key(content)
+        imports = _disk_cache_read(disk_key)
+        if imports is None:
+            imports = ASTParser._parse_imports(content, file_path)
+            _disk_cache_write(disk_key, imports)
+
+        _memory_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, imports)
+        return set(imports)
+
+    @staticmethod
+    def _parse_imports(content: str, file_path: Path) -> Set[str]:
+        """
+        Parse source text and collect its import strings (cache miss path).
+
+        Args:
+            content: The file's source text.
+            file_path: Path used for error reporting.
+
+        Returns:
+            Set of import strings found in the source.
+        """
+        # Fast path: simple files (no strings/compound statements that could
+        # confuse the scanner) are handled by a single regex pass
+        if not any(marker in content for marker in _FAST_PATH_DISQUALIFIERS):
+            imports = _scan_imports_fast(content)
+            if imports is not None:
+                return imports
+
         try:
             tree = ast.parse(content, filename=str(file_path))
-        except SyntaxError as e:
+        except SyntaxError:
             # Log and continue - some files might have syntax errors
             # In production, you might want to log this
             return set()
-        
-        imports = set()
+
         visitor = _ImportVisitor()
         visitor.visit(tree)
         return visitor.imports
@@ -57,18 +250,18 @@ class ASTParser:
 class _ImportVisitor(ast.NodeVisitor):
     """
     Internal AST visitor class for collecting import statements.
-    
+
     This class walks the AST and collects all import-related statements.
     """
-    
+
     def __init__(self):
         """Initialize the visitor with an empty imports set."""
         self.imports = set()
-    
+
     def visit_Import(self, node: ast.Import):
         """
         Visit a standard import statement.
-        
+
         Examples:
             import os -> adds "os"
             import os as operating_system -> adds "os"
@@ -77,11 +270,11 @@ class _ImportVisitor(ast.NodeVisitor):
         for alias in node.names:
             self.imports.add(alias.name)
         self.generic_visit(node)
-    
+
     def visit_ImportFrom(self, node: ast.ImportFrom):
         """
         Visit a from-import statement.
-        
+
         Examples:
             from os import path -> adds "os.path"
             from os import path as p -> adds "os.path"
@@ -99,10 +292,10 @@ class _ImportVisitor(ast.NodeVisitor):
             else:
                 # e.g., 'from .pkg import submod'
                 module_base = f"{dots}{node.module}"
-            
+
             if module_base:
                 self.imports.add(module_base)
-            
+
             if node.names:
                 for alias in node.names:
                     if alias.name == '*':
@@ -118,7 +311,7 @@ class _ImportVisitor(ast.NodeVisitor):
                 module_base = ""
             else:
                 module_base = node.module
-            
+
             # For absolute imports, add the full dotted names including imported items
             # If there are specific imports, create full dotted names
             if node.names:
@@ -129,6 +322,5 @@ class _ImportVisitor(ast.NodeVisitor):
                 # from module import * - just add the module
                 if module_base:
                     self.imports.add(module_base)
-        
-        self.generic_visit(node)
 
+        self.generic_visit(node)
@@ -1,25 +1,27 @@
 """Project class for discovering and managing Python files in a project."""
 
+import os
+import re
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional
 import fnmatch
 
 
 class Project:
     """
     Represents a Python project being analyzed.
-    
+
     This class is responsible for discovering all Python files in a project
     directory, respecting exclusion patterns.
-    
+
     Attributes:
         root_path (Path): The absolute path to the project root directory.
     """
-    
+
     def __init__(self, root_path: Path):
         """
         Initialize a Project instance.
-        
+
         Args:
             root_path: Path to the project root directory.
         """
@@ -28,7 +30,7 @@ class Project:
             raise ValueError(f"Project path does not exist: {root_path}")
         if not self.root_path.is_dir():
             raise ValueError(f"Project path is not a directory: {root_path}")
-    
+
     def get_python_files(
         self,
         exclude_patterns: List[str] = None,
@@ -36,16 +38,19 @@ class Project:
     ) -> List[Path]:
         """
         Discover all Python files in the project.
-        
-        Recursively scans the project directory for .py files, excluding
-        directories and files that match any of the provided patterns.
-        
+
+        Walks the project directory iteratively with os.scandir, which
+        answers is_dir() from the directory read itself instead of issuing
+        extra stat calls per entry. Excluded directories are pruned before
+        descending into them, and all exclude globs are compiled into a
+        single regex up front.
+
         Args:
             exclude_patterns: Custom glob patterns to exclude (e.g., ['venv', '*.test.py']).
                               Patterns can match file or directory names.
             include_defaults: When True (default) also excludes common virtualenv,
                               cache, and VCS directories that should never be parsed.
-        
+
         Returns:
             List of absolute Path objects for each Python file found.
         """
@@ -66,50 +71,48 @@ class Project:
                 ".pytest_cache",
             ]
             exclude_patterns = list(dict.fromkeys(default_excludes + exclude_patterns))
+        matcher = self._compile_patterns(exclude_patterns)
         python_files = []
-        
-        # Get all .py files recursively
-        for py_file in self.root_path.rglob("*.py"):
-            # Skip if any exclusion pattern matches
-            if self._should_exclude(py_file, exclude_patterns):
+
+        # Iterative DFS; each stack entry carries the directory path and its
+        # relative prefix so path-style patterns can match without building
+        # Path objects per entry
+        stack = [(str(self.root_path), '')]
+        while stack:
+            dir_path, rel_prefix = stack.pop()
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
                 continue
-            
-            python_files.append(py_file)
-        
+            with entries:
+                for entry in entries:
+                    rel_name = f"{rel_prefix}{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune excluded directories before descending
+                        if matcher is None or not matcher.match(entry.name):
+                            stack.append((entry.path, f"{rel_name}/"))
+                    elif entry.name.endswith('.py'):
+                        # Skip if the file name or its relative path matches
+                        if matcher is not None and (
+                            matcher.match(entry.name) or matcher.match(rel_name)
+                        ):
+                            continue
+                        python_files.append(Path(entry.path))
+
         return python_files
-    
-    def _should_exclude(self, file_path: Path, patterns: List[str]) -> bool:
+
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> Optional[re.Pattern]:
         """
-        Check if a file should be excluded based on patterns.
-        
+        Compile exclusion globs into a single alternation regex.
+
         Args:
-            file_path: The file path to check.
             patterns: List of glob patterns.
-        
+
         Returns:
-            True if the file should be excluded, False otherwise.
+            A compiled pattern matching any of the globs, or None when the
+            list is empty.
         """
-        # Convert to relative path for comparison
-        try:
-            relative_path = file_path.relative_to(self.root_path)
-        except ValueError:
-            # This shouldn't happen, but handle it gracefully
-            return True
-        
-        # Check each pattern
-        for pattern in patterns:
-            # Check if pattern matches the file name
-            if fnmatch.fnmatch(file_path.name, pattern):
-                return True
-            
-            # Check if the full relative path matches (e.g., pkg/utils.py)
-            if fnmatch.fnmatch(str(relative_path).replace('\\', '/'), pattern):
-                return True
-            
-            # Check if pattern matches any part of the path
-            for part in relative_path.parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
-        
-        return False
-
+        if not patterns:
+            return None
+        return re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns))
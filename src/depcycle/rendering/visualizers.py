@@ -1,5 +1,9 @@
 """Concrete visualization implementations for different output formats."""
 
+import hashlib
+import json
+import os
+import shutil
 from pathlib import Path
 from typing import Dict
 
@@ -8,6 +12,54 @@ from ..graph.dependency_graph import DependencyGraph
 from ..graph.module_node import ModuleType
 from ..config import Config
 
+# Node styles, hoisted to module level so the render loop does a single
+# lookup per node instead of rebuilding these dicts for every call
+_STYLE_CYCLE = {
+    'color': '#7F0000',      # Dark red border
+    'fillcolor': '#F97068',  # Accessible red
+    'style': 'filled,rounded,bold',
+    'fontcolor': '#FFFFFF',
+    'fontsize': '10',
+    'penwidth': '2.5'        # Thicker border
+}
+_STYLE_LOCAL = {
+    'color': '#1E88E5',      # Blue border (CB-friendly)
+    'fillcolor': '#BBDEFB',  # Light blue background
+    'style': 'filled,rounded',
+    'fontcolor': '#000000',  # Black text
+    'fontsize': '10'
+}
+_STYLE_THIRD_PARTY = {
+    'color': '#FB8C00',      # Orange border
+    'fillcolor': '#FFE0B2',  # Light orange background
+    'style': 'filled,rounded',
+    'fontcolor': '#000000',  # Black text
+    'fontsize': '10'
+}
+_STYLE_STDLIB = {
+    'color': '#6D6D6D',      # Gray border
+    'fillcolor': '#EEEEEE',  # Light gray background
+    'style': 'filled,rounded',
+    'fontcolor': '#333333',  # Dark gray text
+    'fontsize': '9'
+}
+_STYLE_BY_TYPE = {
+    ModuleType.LOCAL: _STYLE_LOCAL,
+    ModuleType.THIRD_PARTY: _STYLE_THIRD_PARTY,
+    ModuleType.STDLIB: _STYLE_STDLIB,
+}
+
+# Edge styles: cycle edges get an accessible red and a thicker line
+_EDGE_CYCLE = {'color': '#D32F2F', 'penwidth': '3.0'}
+_EDGE_NORMAL = {'color': '#708090', 'penwidth': '1.5'}  # Slate gray
+
+def _render_cache_dir() -> Path:
+    """Return the directory used for cached rendered images."""
+    base = os.environ.get('XDG_CACHE_HOME')
+    if base:
+        return Path(base) / 'depcycle' / 'render'
+    return Path.home() / '.cache' / 'depcycle' / 'render'
+
 
 class GraphvizVisualizer(IGraphVisualizer):
     """
@@ -17,6 +69,11 @@ class GraphvizVisualizer(IGraphVisualizer):
     graphviz Python library to create standard graph visualizations.
     """
     
+    # Characters rewritten when module names become Graphviz identifiers.
+    # Subclasses can extend this mapping; the translate table is compiled
+    # from it once per instance.
+    _escape_chars = {'.': '_', '-': '_'}
+
     def __init__(self):
         """Initialize the GraphvizVisualizer."""
         try:
@@ -27,11 +84,16 @@ class GraphvizVisualizer(IGraphVisualizer):
                 "graphviz is required for PNG/SVG output. "
                 "Install it with: pip install graphviz"
             )
+        self._escape_table = str.maketrans(self._escape_chars)
     
     def render(self, graph: DependencyGraph, config: Config):
         """
         Render the dependency graph as a PNG or SVG image.
-        
+
+        The DOT source is assembled as a flat list of statements and handed
+        to graphviz.Source in one piece, skipping the per-node/per-edge
+        overhead of the Digraph builder API.
+
         Args:
             graph: The DependencyGraph to visualize.
             config: Configuration including output path and format.
@@ -41,13 +103,82 @@ class GraphvizVisualizer(IGraphVisualizer):
         chosen_format = config.output_format
         if chosen_format == 'png' and node_count > 100:
             chosen_format = 'svg'
-        
-        # Create a new directed graph
-        dot = self.graphviz.Digraph(
-            comment='Dependency Graph',
-            format=chosen_format,
-            engine='dot',
-            graph_attr={
+
+        dot_src = self._build_dot_source(graph, config)
+
+        # Render to file
+        output_path = Path(config.output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Adjust output file extension if we switched format
+        final_output_path = output_path
+        if output_path.suffix.lower().lstrip('.') != chosen_format:
+            final_output_path = output_path.with_suffix(f'.{chosen_format}')
+
+        # Unchanged DOT source renders to an identical image, so an earlier
+        # result can be reused without launching the dot binary at all
+        cache_key = hashlib.sha256((dot_src + chosen_format).encode('utf-8')).hexdigest()
+        cached_file = _render_cache_dir() / f"{cache_key}.{chosen_format}"
+        if cached_file.is_file():
+            shutil.copy(cached_file, final_output_path)
+            return
+
+        # graphviz expects path without extension
+        base_path = final_output_path.with_suffix('')
+        source = self.graphviz.Source(dot_src, format=chosen_format, engine='dot')
+        source.render(base_path, cleanup=True)
+
+        # Populate the cache for the next run; failures are non-fatal
+        try:
+            cached_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(final_output_path, cached_file)
+        except OSError:
+            pass
+
+    def _build_dot_source(self, graph: DependencyGraph, config: Config) -> str:
+        """
+        Build the complete DOT source for a graph as a single string.
+
+        Args:
+            graph: The DependencyGraph to serialize.
+            config: Configuration controlling rendering options.
+
+        Returns:
+            DOT source text ready to pass to Graphviz.
+        """
+        node_count = len(graph.nodes)
+
+        # Optionally collapse external modules into aggregate nodes, which
+        # shrinks the node/edge count Graphviz has to lay out
+        if config.collapse_external:
+            aggregates, aliases = self._collapse_external_nodes(graph)
+        else:
+            aggregates, aliases = {}, {}
+
+        # Detect circular dependencies; the frozen sets give the hot
+        # membership checks below stable O(1) lookups. Comprehensions keep
+        # the flattening inside the C evaluator, pairing each cycle member
+        # with its successor (wrapping around).
+        cycle_names = [[node.name for node in cycle] for cycle in graph.find_cycles()]
+        nodes_in_cycles = frozenset(
+            name for names in cycle_names for name in names
+        )
+        edges_in_cycles = frozenset(
+            pair for names in cycle_names for pair in zip(names, names[1:] + names[:1])
+        )
+
+        # Group nodes by top-level package for clustering
+        groups: Dict[str, list] = {}
+        for node in graph.nodes.values():
+            if node.name in aliases:
+                continue  # Represented by an aggregate node instead
+            top = node.name.split('.')[0] if '.' in node.name else node.name
+            groups.setdefault(top, []).append(node)
+
+        parts = [
+            '// Dependency Graph',
+            'digraph {',
+            '    graph [' + self._format_attrs({
                 'rankdir': 'LR',  # Left to Right improves readability
                 'bgcolor': 'white',
                 'dpi': '300',
@@ -57,313 +188,363 @@ class GraphvizVisualizer(IGraphVisualizer):
                 'ranksep': '1.1',
                 'fontname': 'Helvetica',
                 'pad': '0.4'
-            }
-        )
-        # Standardize edge appearance
-        dot.attr('edge', arrowhead='normal', arrowsize='0.8')
-        
-        # Detect circular dependencies
-        cycles = graph.find_cycles()
-        nodes_in_cycles = set()
-        edges_in_cycles = set()
-        
-        for cycle in cycles:
-            for node in cycle:
-                nodes_in_cycles.add(node.name)
-            # Create edge pairs for the cycle
-            for i in range(len(cycle)):
-                source = cycle[i].name
-                target = cycle[(i + 1) % len(cycle)].name
-                edges_in_cycles.add((source, target))
-        
-        # Group nodes by top-level package for clustering
-        groups: Dict[str, list] = {}
-        for node in graph.nodes.values():
-            top = node.name.split('.')[0] if '.' in node.name else node.name
-            groups.setdefault(top, []).append(node)
-        
+            }) + ']',
+            # Standardize edge appearance
+            '    edge [arrowhead="normal" arrowsize="0.8"]',
+        ]
+
         # Add nodes inside clusters
         for group_name, nodes in sorted(groups.items(), key=lambda kv: kv[0]):
-            with dot.subgraph(name=f'cluster_{self._escape_node_name(group_name)}') as sub:
-                sub.attr(label=group_name, style='rounded', color='#D0D0D0', fontname='Helvetica', fontsize='12')
-                for node in nodes:
-                    is_in_cycle = node.name in nodes_in_cycles
-                    self._add_node(sub, node, is_in_cycle)
-        
-        # Add edges
-        for node in graph.nodes.values():
-            for dependency in node.dependencies:
-                # Only add edge if both nodes are in the graph
-                if dependency.name in graph.nodes:
-                    edge_in_cycle = (node.name, dependency.name) in edges_in_cycles
-                    self._add_edge(dot, node.name, dependency.name, edge_in_cycle)
-        
+            parts.append(f'    subgraph "cluster_{self._escape_node_name(group_name)}" {{')
+            parts.append('        ' + self._format_attrs({
+                'label': group_name,
+                'style': 'rounded',
+                'color': '#D0D0D0',
+                'fontname': 'Helvetica',
+                'fontsize': '12',
+            }, sep='\n        '))
+            for node in nodes:
+                is_in_cycle = node.name in nodes_in_cycles
+                self._add_node(parts, node, is_in_cycle)
+            parts.append('    }')
+
+        # Add aggregate nodes for collapsed external packages
+        for group_id, (top, module_type, count) in sorted(aggregates.items()):
+            style = _STYLE_BY_TYPE.get(module_type, _STYLE_STDLIB)
+            label = top if count == 1 else f"{top} ({count} modules)"
+            attrs = self._format_attrs({'label': label, 'tooltip': top, 'shape': 'folder', **style})
+            parts.append(f'    "{group_id}" [{attrs}]')
+
+        # Add edges; edges into a collapsed group are merged and weighted.
+        # The SoA view pre-filters dangling dependencies, so no membership
+        # check is needed per edge.
+        soa = graph.as_soa()
+        names = soa.names
+        collapsed_edges: Dict[tuple, int] = {}
+        for source_index, dep_indices in enumerate(soa.dep_indices):
+            source_name = names[source_index]
+            for target_index in dep_indices:
+                target_name = names[target_index]
+                source_id = aliases.get(source_name)
+                target_id = aliases.get(target_name)
+                if source_id is None and target_id is None:
+                    edge_in_cycle = (source_name, target_name) in edges_in_cycles
+                    self._add_edge(parts, source_name, target_name, edge_in_cycle)
+                    continue
+                if source_id is None:
+                    source_id = self._escape_node_name(source_name)
+                if target_id is None:
+                    target_id = self._escape_node_name(target_name)
+                if source_id != target_id:
+                    key = (source_id, target_id)
+                    collapsed_edges[key] = collapsed_edges.get(key, 0) + 1
+
+        for (source_id, target_id), count in sorted(collapsed_edges.items()):
+            edge_attr = dict(_EDGE_NORMAL)
+            if count > 1:
+                edge_attr['label'] = str(count)
+            parts.append(f'    "{source_id}" -> "{target_id}" [{self._format_attrs(edge_attr)}]')
+
         # Add title and legend
-        self._add_title(dot, node_count)
-        self._add_legend(dot)
-        
-        # Render to file
-        output_path = Path(config.output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Adjust output file extension if we switched format
-        final_output_path = output_path
-        if output_path.suffix.lower().lstrip('.') != chosen_format:
-            final_output_path = output_path.with_suffix(f'.{chosen_format}')
-        
-        # graphviz expects path without extension
-        base_path = final_output_path.with_suffix('')
-        dot.render(base_path, cleanup=True)
-    
-    def _add_node(self, dot, node, is_in_cycle=False):
+        self._add_title(parts, node_count)
+        self._add_legend(parts)
+
+        parts.append('}')
+        return '\n'.join(parts)
+
+    def _collapse_external_nodes(self, graph: DependencyGraph):
         """
-        Add a node to the graph with appropriate styling.
-        
+        Group stdlib and third-party nodes by top-level package.
+
+        Args:
+            graph: The DependencyGraph being rendered.
+
+        Returns:
+            Tuple of (aggregates, aliases) where aggregates maps a synthetic
+            node id to [top_level_name, module_type, member_count] and
+            aliases maps each collapsed module name to its aggregate id.
+        """
+        aggregates: Dict[str, list] = {}
+        aliases: Dict[str, str] = {}
+
+        for node in graph.nodes.values():
+            if node.module_type == ModuleType.LOCAL:
+                continue
+            top = node.name.split('.')[0]
+            group_id = f"{node.module_type.value}_{self._escape_node_name(top)}"
+            aliases[node.name] = group_id
+            entry = aggregates.setdefault(group_id, [top, node.module_type, 0])
+            entry[2] += 1
+
+        return aggregates, aliases
+
+    def _add_node(self, parts: list, node, is_in_cycle=False):
+        """
+        Append a styled node statement to the DOT source buffer.
+
         Args:
-            dot: The graphviz Digraph object.
+            parts: The list of DOT statements being assembled.
             node: The ModuleNode to add.
             is_in_cycle: Whether this node is part of a circular dependency.
         """
         escaped_name = self._escape_node_name(node.name)
-        
+
         # Highlight circular dependencies with red background
         if is_in_cycle:
-            style = {
-                'color': '#7F0000',      # Dark red border
-                'fillcolor': '#F97068',  # Accessible red
-                'style': 'filled,rounded,bold',
-                'fontcolor': '#FFFFFF',
-                'fontsize': '10',
-                'penwidth': '2.5'        # Thicker border
-            }
-        elif node.module_type == ModuleType.LOCAL:
-            style = {
-                'color': '#1E88E5',      # Blue border (CB-friendly)
-                'fillcolor': '#BBDEFB',  # Light blue background
-                'style': 'filled,rounded',
-                'fontcolor': '#000000',  # Black text
-                'fontsize': '10'
-            }
-        elif node.module_type == ModuleType.THIRD_PARTY:
-            style = {
-                'color': '#FB8C00',      # Orange border
-                'fillcolor': '#FFE0B2',  # Light orange background
-                'style': 'filled,rounded',
-                'fontcolor': '#000000',  # Black text
-                'fontsize': '10'
-            }
-        else:  # STDLIB
-            style = {
-                'color': '#6D6D6D',      # Gray border
-                'fillcolor': '#EEEEEE',  # Light gray background
-                'style': 'filled,rounded',
-                'fontcolor': '#333333',  # Dark gray text
-                'fontsize': '9'
-            }
-        
+            style = _STYLE_CYCLE
+        else:
+            style = _STYLE_BY_TYPE.get(node.module_type, _STYLE_STDLIB)
+
         # Truncate long names for display
         display_name = node.name
         if len(display_name) > 40:
             display_name = display_name[:37] + "..."
-        
-        dot.node(escaped_name, display_name, tooltip=node.name, **style)
-    
-    def _add_edge(self, dot, source: str, target: str, is_in_cycle: bool = False):
+
+        attrs = self._format_attrs({'label': display_name, 'tooltip': node.name, **style})
+        parts.append(f'        "{escaped_name}" [{attrs}]')
+
+    def _add_edge(self, parts: list, source: str, target: str, is_in_cycle: bool = False):
         """
-        Add an edge to the graph with appropriate styling.
-        
+        Append a styled edge statement to the DOT source buffer.
+
         Args:
-            dot: The graphviz Digraph object.
+            parts: The list of DOT statements being assembled.
             source: Source node name.
             target: Target node name.
             is_in_cycle: Whether this edge is part of a circular dependency.
         """
-        edge_attr = {}
-        
-        if is_in_cycle:
-            # Highlight cycle edges with red and thicker line
-            edge_attr = {
-                'color': '#D32F2F',    # Accessible red
-                'penwidth': '3.0'      # Thicker line
-            }
-        else:
-            # Normal edges
-            edge_attr = {
-                'color': '#708090',    # Slate gray
-                'penwidth': '1.5'
-            }
-        
-        dot.edge(
-            self._escape_node_name(source),
-            self._escape_node_name(target),
-            **edge_attr
+        edge_attr = _EDGE_CYCLE if is_in_cycle else _EDGE_NORMAL
+
+        attrs = self._format_attrs(edge_attr)
+        parts.append(
+            f'    "{self._escape_node_name(source)}" -> '
+            f'"{self._escape_node_name(target)}" [{attrs}]'
+        )
+
+    @staticmethod
+    def _format_attrs(attrs: dict, sep: str = ' ') -> str:
+        """
+        Format an attribute dict as DOT key="value" pairs.
+
+        Backslashes and double quotes in values are escaped so arbitrary
+        labels and tooltips cannot break out of the quoted string.
+
+        Args:
+            attrs: Attribute names and values.
+            sep: Separator between pairs.
+
+        Returns:
+            The formatted attribute string (without brackets).
+        """
+        return sep.join(
+            '{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+            for key, value in attrs.items()
         )
     
     def _escape_node_name(self, name: str) -> str:
         """
         Escape special characters in node names for Graphviz.
-        
+
+        Translates through the table compiled from _escape_chars in one
+        C-level pass, so the cost stays flat however many substitutions the
+        class (or a subclass) declares.
+
         Args:
             name: The module name.
-        
+
         Returns:
             An escaped version safe for Graphviz.
         """
-        return name.replace('.', '_').replace('-', '_')
+        return name.translate(self._escape_table)
     
-    def _add_title(self, dot, node_count: int):
+    def _add_title(self, parts: list, node_count: int):
         """
         Add a title to the graph.
-        
+
         Args:
-            dot: The graphviz Digraph object.
+            parts: The list of DOT statements being assembled.
             node_count: Number of nodes in the graph.
         """
         title = f"Dependency Graph • {node_count} modules"
-        dot.attr(label=title, labelloc='t', fontsize='16', fontname='Helvetica', fontcolor='#333333')
+        parts.append('    ' + self._format_attrs({
+            'label': title,
+            'labelloc': 't',
+            'fontsize': '16',
+            'fontname': 'Helvetica',
+            'fontcolor': '#333333',
+        }, sep='\n    '))
 
-    def _add_legend(self, dot):
+    def _add_legend(self, parts: list):
         """
         Add a legend explaining colors and cycle highlighting.
         """
-        with dot.subgraph(name='cluster_legend') as legend:
-            legend.attr(label='Legend', color='#B0B0B0', style='rounded', fontname='Helvetica', fontsize='12')
-            # Create example nodes
-            legend.node('legend_local', 'Local', shape='box', style='filled,rounded', fillcolor='#BBDEFB', color='#1E88E5')
-            legend.node('legend_third', 'Third-party', shape='box', style='filled,rounded', fillcolor='#FFE0B2', color='#FB8C00')
-            legend.node('legend_std', 'Stdlib', shape='box', style='filled,rounded', fillcolor='#EEEEEE', color='#6D6D6D')
-            legend.node('legend_cycle', 'In Cycle', shape='box', style='filled,rounded,bold', fillcolor='#F97068', color='#7F0000', fontcolor='#FFFFFF')
-            # Arrange legend nodes
-            legend.attr(rank='same')
-            legend.edges([('legend_local', 'legend_third'), ('legend_third', 'legend_std'), ('legend_std', 'legend_cycle')])
+        legend_nodes = [
+            ('legend_local', 'Local',
+             {'shape': 'box', 'style': 'filled,rounded', 'fillcolor': '#BBDEFB', 'color': '#1E88E5'}),
+            ('legend_third', 'Third-party',
+             {'shape': 'box', 'style': 'filled,rounded', 'fillcolor': '#FFE0B2', 'color': '#FB8C00'}),
+            ('legend_std', 'Stdlib',
+             {'shape': 'box', 'style': 'filled,rounded', 'fillcolor': '#EEEEEE', 'color': '#6D6D6D'}),
+            ('legend_cycle', 'In Cycle',
+             {'shape': 'box', 'style': 'filled,rounded,bold', 'fillcolor': '#F97068',
+              'color': '#7F0000', 'fontcolor': '#FFFFFF'}),
+        ]
 
+        parts.append('    subgraph "cluster_legend" {')
+        parts.append('        ' + self._format_attrs({
+            'label': 'Legend',
+            'color': '#B0B0B0',
+            'style': 'rounded',
+            'fontname': 'Helvetica',
+            'fontsize': '12',
+        }, sep='\n        '))
+        for name, label, style in legend_nodes:
+            attrs = self._format_attrs({'label': label, **style})
+            parts.append(f'        "{name}" [{attrs}]')
+        # Arrange legend nodes
+        parts.append('        rank="same"')
+        for (source, _, _), (target, _, _) in zip(legend_nodes, legend_nodes[1:]):
+            parts.append(f'        "{source}" -> "{target}"')
+        parts.append('    }')
 
-class HtmlVisualizer(IGraphVisualizer):
-    """
-    Visualizer for generating interactive HTML output using D3.js.
-    
-    This creates an interactive, web-based visualization that allows
-    users to explore dependencies dynamically.
-    """
-    
-    def render(self, graph: DependencyGraph, config: Config):
-        """
-        Render the dependency graph as an interactive HTML page.
-        
-        Args:
-            graph: The DependencyGraph to visualize.
-            config: Configuration including output path.
-        """
-        # Generate node data
-        nodes = []
-        links = []
-        
-        # Create node mapping
-        node_id_map = {}
-        for idx, node in enumerate(graph.nodes.values()):
-            node_id_map[node.name] = idx
-            nodes.append({
-                'id': idx,
-                'name': node.name,
-                'type': node.module_type.value,
-                'deps_count': len(node.dependencies)
-            })
-        
-        # Create links
-        for node in graph.nodes.values():
-            source_idx = node_id_map[node.name]
-            for dependency in node.dependencies:
-                if dependency.name in node_id_map:
-                    target_idx = node_id_map[dependency.name]
-                    links.append({
-                        'source': source_idx,
-                        'target': target_idx
-                    })
-        
-        # Generate HTML
-        html_content = self._generate_html(nodes, links)
-        
-        # Write to file
-        output_path = Path(config.output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html_content, encoding='utf-8')
-    
-    def _generate_html(self, nodes: list, links: list) -> str:
-        """
-        Generate the HTML content with embedded JavaScript.
-        
-        Args:
-            nodes: List of node data dictionaries.
-            links: List of link data dictionaries.
-        
-        Returns:
-            Complete HTML as a string.
-        """
-        # This is a simplified HTML visualizer
-        # In production, you'd want to use a proper templating engine
-        return f"""<!DOCTYPE html>
+
+# HTML page template, split where dynamic content is written so the output
+# can be streamed chunk by chunk without assembling one large string
+_HTML_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Dependency Graph</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #2E86AB;
             margin-bottom: 20px;
-        }}
-        .stats {{
+        }
+        .stats {
             background: #f8f9fa;
             padding: 15px;
             border-radius: 5px;
             margin-bottom: 20px;
-        }}
-        .stats p {{
+        }
+        .stats p {
             margin: 5px 0;
-        }}
-        #graph {{
+        }
+        #graph {
             border: 1px solid #ddd;
             border-radius: 5px;
             min-height: 600px;
             background: #fafafa;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>Dependency Graph</h1>
         <div class="stats">
-            <p><strong>Total Modules:</strong> {len(nodes)}</p>
-            <p><strong>Total Dependencies:</strong> {len(links)}</p>
+            <p><strong>Total Modules:</strong> """
+
+_HTML_STATS_MID = """</p>
+            <p><strong>Total Dependencies:</strong> """
+
+_HTML_NODES_LEAD = """</p>
         </div>
         <div id="graph">
             <p style="text-align: center; padding: 50px; color: #666;">
-                Interactive visualization coming soon. 
+                Interactive visualization coming soon.
                 Please use Graphviz output for now.
             </p>
         </div>
     </div>
     <script>
         // Nodes data would be used here with D3.js in a full implementation
-        const nodes = {nodes};
-        const links = {links};
-        console.log("Graph data loaded:", {{ nodes, links }});
+        const nodes = """
+
+_HTML_LINKS_LEAD = """;
+        const links = """
+
+_HTML_SUFFIX = """;
+        console.log("Graph data loaded:", { nodes, links });
     </script>
 </body>
 </html>
 """
 
+
+class HtmlVisualizer(IGraphVisualizer):
+    """
+    Visualizer for generating interactive HTML output using D3.js.
+
+    This creates an interactive, web-based visualization that allows
+    users to explore dependencies dynamically.
+    """
+    
+    def render(self, graph: DependencyGraph, config: Config):
+        """
+        Render the dependency graph as an interactive HTML page.
+        
+        Args:
+            graph: The DependencyGraph to visualize.
+            config: Configuration including output path.
+        """
+        # Generate node and link data from the array view; node ids are the
+        # array indices, so no name-to-id mapping is needed
+        soa = graph.as_soa()
+        nodes = [
+            {
+                'id': index,
+                'name': name,
+                'type': module_type.value,
+                'deps_count': len(dep_indices)
+            }
+            for index, (name, module_type, dep_indices)
+            in enumerate(zip(soa.names, soa.module_types, soa.dep_indices))
+        ]
+        links = [
+            {'source': source_index, 'target': target_index}
+            for source_index, dep_indices in enumerate(soa.dep_indices)
+            for target_index in dep_indices
+        ]
+        
+        # Stream the HTML to disk; json.dump writes straight into the file
+        # buffer, so the multi-MB data blobs of large graphs are never
+        # materialized as intermediate strings
+        output_path = Path(config.output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open('w', encoding='utf-8', buffering=1 << 20) as fp:
+            self._write_html(fp, nodes, links)
+    
+    def _write_html(self, fp, nodes: list, links: list):
+        """
+        Write the HTML document to an open text file in chunks.
+
+        Args:
+            fp: Writable text file object.
+            nodes: List of node data dictionaries.
+            links: List of link data dictionaries.
+        """
+        # This is a simplified HTML visualizer
+        # In production, you'd want to use a proper templating engine
+        fp.write(_HTML_PREFIX)
+        fp.write(str(len(nodes)))
+        fp.write(_HTML_STATS_MID)
+        fp.write(str(len(links)))
+        fp.write(_HTML_NODES_LEAD)
+        json.dump(nodes, fp, separators=(",", ":"))
+        fp.write(_HTML_LINKS_LEAD)
+        json.dump(links, fp, separators=(",", ":"))
+        fp.write(_HTML_SUFFIX)
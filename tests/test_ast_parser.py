@@ -27,3 +27,54 @@ def test_ast_parser_extracts_all_import_shapes(tmp_path: Path):
     assert "." in imports  # from . import localmod
     assert ".pkg" in imports  # from .pkg import submod
 
+
+def test_ast_parser_handles_parenthesized_and_conditional_imports(tmp_path: Path):
+    code = textwrap.dedent(
+        """
+        from os.path import (
+            join,
+            split as s,
+        )
+
+        try:
+            import fast_json
+        except ImportError:
+            import json as fast_json
+        """
+    )
+    file_path = tmp_path / "module.py"
+    file_path.write_text(code, encoding="utf-8")
+
+    imports = ASTParser.get_imports_from_file(file_path)
+
+    assert "os.path.join" in imports
+    assert "os.path.split" in imports
+    assert "fast_json" in imports
+    assert "json" in imports
+
+
+def test_ast_parser_handles_unusual_import_spellings(tmp_path: Path):
+    # Legal but odd spellings that a line scanner could miss; they must
+    # fall through to the AST path rather than being dropped
+    file_path = tmp_path / "module.py"
+    file_path.write_text("from.x import y\n", encoding="utf-8")
+
+    imports = ASTParser.get_imports_from_file(file_path)
+
+    assert ".x" in imports
+    assert ".x.y" in imports
+
+
+def test_ast_parser_cache_invalidates_on_file_change(tmp_path: Path):
+    file_path = tmp_path / "module.py"
+    file_path.write_text("import os\n", encoding="utf-8")
+
+    first = ASTParser.get_imports_from_file(file_path)
+    assert first == {"os"}
+
+    # Rewrite the file; the cached result must not be reused
+    file_path.write_text("import sys\n", encoding="utf-8")
+
+    second = ASTParser.get_imports_from_file(file_path)
+    assert second == {"sys"}
+